@@ -4,11 +4,17 @@ Macro & Web3 Strategic Dashboard - Metrics Fetcher
 Fetches 6 key financial/crypto metrics from multiple data sources.
 """
 
+import hashlib
+import heapq
+import html
 import json
+import os
 import requests
+import socket
+import sqlite3
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import yfinance as yf
 from fredapi import Fred
 from tabulate import tabulate
@@ -24,6 +30,278 @@ THRESHOLDS = {
     'fed_net_liquidity': 0.0,      # Any change (critical metric)
 }
 
+# DefiLlama categories counted towards RWA TVL
+RWA_CATEGORIES = ["RWA", "RWA Lending", "Private Credit", "Real World Assets"]
+
+# Per-protocol RWA TVL snapshot (persisted between runs for diffing)
+RWA_SNAPSHOT_FILE = "rwa_snapshot.json"
+
+# Number of top inflows/outflows to keep
+RWA_TOP_MOVERS = 5
+
+# Job coordination between concurrent runners (enabled by setting LEASE_DB_PATH)
+LEASE_TTL_SECONDS = 120         # Lease expiry if a runner dies mid-fetch
+RESULT_MAX_AGE_SECONDS = 300    # Reuse another runner's result if fetched within this window
+LEASE_POLL_SECONDS = 2          # Wait between checks on sources leased by another runner
+
+
+def diff_protocol_snapshots(previous: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]],
+                            top_k: int = RWA_TOP_MOVERS) -> Dict[str, Any]:
+    """
+    Diff two per-protocol TVL snapshots keyed by slug.
+    Single hash-join pass over each side; top-k movers are kept in bounded heaps.
+    
+    Args:
+        previous: Previous snapshot ({slug: {"name", "category", "tvl"}})
+        current: Current snapshot in the same format
+        top_k: Number of inflows/outflows to keep
+        
+    Returns:
+        Dictionary with top inflows, top outflows, entered and exited protocols
+    """
+    inflows = []   # min-heap of (delta, slug) holding the largest positive deltas
+    outflows = []  # min-heap of (-delta, slug) holding the largest negative deltas
+    entered = []
+    exited = []
+    
+    def push(heap, key, slug):
+        if len(heap) < top_k:
+            heapq.heappush(heap, (key, slug))
+        elif key > heap[0][0]:
+            heapq.heapreplace(heap, (key, slug))
+    
+    # Movers only cover protocols present in both snapshots; entries/exits are reported separately
+    for slug, protocol in current.items():
+        old = previous.get(slug)
+        if old is None:
+            entered.append(slug)
+            continue
+        delta = protocol['tvl'] - old['tvl']
+        if delta > 0:
+            push(inflows, delta, slug)
+        elif delta < 0:
+            push(outflows, -delta, slug)
+    
+    for slug in previous:
+        if slug not in current:
+            exited.append(slug)
+    
+    def mover(slug, delta):
+        old_tvl = previous[slug]['tvl']
+        return {
+            "slug": slug,
+            "name": current[slug].get('name', slug),
+            "tvl": current[slug]['tvl'],
+            "delta": delta,
+            "delta_pct": (delta / old_tvl) * 100 if old_tvl else None,
+        }
+    
+    return {
+        "top_inflows": [mover(slug, delta) for delta, slug in sorted(inflows, reverse=True)],
+        "top_outflows": [mover(slug, -delta) for delta, slug in sorted(outflows, reverse=True)],
+        "entered": [{"slug": slug, "name": current[slug].get('name', slug), "tvl": current[slug]['tvl']}
+                    for slug in entered],
+        "exited": [{"slug": slug, "name": previous[slug].get('name', slug), "tvl": previous[slug]['tvl']}
+                   for slug in exited],
+    }
+
+
+class LeaseCoordinator:
+    """
+    SQLite-backed lease table shared by concurrent fetch runners.
+    Runners lease sources one by one, publish what they fetched and claim
+    notifications so each change is only sent once.
+    """
+    
+    def __init__(self, db_path: str, owner: Optional[str] = None, ttl: float = LEASE_TTL_SECONDS,
+                 result_max_age: float = RESULT_MAX_AGE_SECONDS):
+        """
+        Initialize the coordinator.
+        
+        Args:
+            db_path: Path to the shared SQLite database
+            owner: Unique runner ID (defaults to hostname-pid)
+            ttl: Lease expiry in seconds
+            result_max_age: How long published results and notification claims are kept, in seconds
+        """
+        self.owner = owner or f"{socket.gethostname()}-{os.getpid()}"
+        self.ttl = ttl
+        self.result_max_age = result_max_age
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS leases (
+                name TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                source TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS notifications (
+                key TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                sent_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS runners (
+                owner TEXT PRIMARY KEY,
+                registered_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS failures (
+                source TEXT NOT NULL,
+                owner TEXT NOT NULL,
+                failed_at REAL NOT NULL,
+                PRIMARY KEY (source, owner)
+            );
+        """)
+    
+    def acquire(self, name: str) -> bool:
+        """
+        Acquire (or renew) a lease. Succeeds if it is free, expired or already ours.
+        
+        Args:
+            name: Lease name
+            
+        Returns:
+            True if this runner now holds the lease
+        """
+        now = time.time()
+        cursor = self.conn.execute(
+            """
+            INSERT INTO leases (name, owner, expires_at) VALUES (?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+            WHERE leases.expires_at < ? OR leases.owner = excluded.owner
+            """,
+            (name, self.owner, now + self.ttl, now)
+        )
+        return cursor.rowcount == 1
+    
+    def release(self, name: str):
+        """
+        Release a lease held by this runner.
+        
+        Args:
+            name: Lease name
+        """
+        self.conn.execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, self.owner))
+    
+    def publish(self, source: str, payload: Dict[str, Any]):
+        """
+        Publish a fetched source so other runners can merge it instead of refetching.
+        Results older than result_max_age are pruned.
+        
+        Args:
+            source: Source name
+            payload: JSON-serializable fetch result
+        """
+        self.conn.execute("DELETE FROM results WHERE fetched_at < ?", (time.time() - self.result_max_age,))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO results (source, owner, payload, fetched_at) VALUES (?, ?, ?, ?)",
+            (source, self.owner, json.dumps(payload), time.time())
+        )
+    
+    def fresh_result(self, source: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a result for a source published within result_max_age.
+        
+        Args:
+            source: Source name
+            
+        Returns:
+            Published payload or None if there is no fresh result
+        """
+        row = self.conn.execute(
+            "SELECT payload FROM results WHERE source = ? AND fetched_at >= ?",
+            (source, time.time() - self.result_max_age)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def claim_notification(self, key: str) -> bool:
+        """
+        Claim a notification. Only the first runner to claim a key may send it.
+        Claims older than result_max_age are pruned.
+        
+        Args:
+            key: Notification fingerprint
+            
+        Returns:
+            True if this runner should send the notification
+        """
+        self.conn.execute("DELETE FROM notifications WHERE sent_at < ?", (time.time() - self.result_max_age,))
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO notifications (key, owner, sent_at) VALUES (?, ?, ?)",
+            (key, self.owner, time.time())
+        )
+        return cursor.rowcount == 1
+    
+    def unclaim_notification(self, key: str):
+        """
+        Drop a notification claim (e.g. sending failed) so another runner may retry.
+        
+        Args:
+            key: Notification fingerprint
+        """
+        self.conn.execute("DELETE FROM notifications WHERE key = ? AND owner = ?", (key, self.owner))
+    
+    def register(self):
+        """
+        Register (or keep alive) this runner. Expired runners are pruned.
+        """
+        now = time.time()
+        self.conn.execute("DELETE FROM runners WHERE expires_at < ?", (now,))
+        self.conn.execute(
+            """
+            INSERT INTO runners (owner, registered_at, expires_at) VALUES (?, ?, ?)
+            ON CONFLICT(owner) DO UPDATE SET expires_at = excluded.expires_at
+            """,
+            (self.owner, now, now + self.ttl)
+        )
+    
+    def unregister(self):
+        """
+        Remove this runner so others stop waiting on it.
+        """
+        self.conn.execute("DELETE FROM runners WHERE owner = ?", (self.owner,))
+    
+    def record_failure(self, source: str):
+        """
+        Record that this runner failed to fetch a source. Old failures are pruned.
+        
+        Args:
+            source: Source name
+        """
+        now = time.time()
+        self.conn.execute("DELETE FROM failures WHERE failed_at < ?", (now - self.result_max_age,))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO failures (source, owner, failed_at) VALUES (?, ?, ?)",
+            (source, self.owner, now)
+        )
+    
+    def failed_by_all(self, source: str) -> bool:
+        """
+        Check whether every live runner has failed a source since it registered.
+        
+        Args:
+            source: Source name
+            
+        Returns:
+            True if no live runner can still fetch the source
+        """
+        row = self.conn.execute(
+            """
+            SELECT COUNT(*) FROM runners r
+            WHERE r.expires_at >= ? AND NOT EXISTS (
+                SELECT 1 FROM failures f
+                WHERE f.source = ? AND f.owner = r.owner AND f.failed_at >= r.registered_at
+            )
+            """,
+            (time.time(), source)
+        ).fetchone()
+        return row[0] == 0
+
 
 class MetricsFetcher:
     """Fetches and processes financial metrics from various sources."""
@@ -38,6 +316,8 @@ class MetricsFetcher:
         self.fred_api_key = fred_api_key
         self.results = []
         self.data = {}
+        self.rwa_snapshot = None
+        self.rwa_movers = None
         
         # Create a custom session for yfinance with User-Agent headers
         self.yf_session = requests.Session()
@@ -234,9 +514,14 @@ class MetricsFetcher:
             self.data["stablecoin_mcap"] = None
             return None
     
-    def fetch_rwa_tvl(self) -> Optional[float]:
+    def fetch_rwa_tvl(self, snapshot_file: str = RWA_SNAPSHOT_FILE) -> Optional[float]:
         """
         Fetch Total RWA (Real World Assets) TVL from DefiLlama.
+        Also builds a per-protocol snapshot and diffs it against the previous run
+        to find the top movers and protocols entering/leaving the RWA categories.
+        
+        Args:
+            snapshot_file: Previous per-protocol snapshot to diff against
         
         Returns:
             Total RWA TVL or None if fetch fails
@@ -250,21 +535,40 @@ class MetricsFetcher:
             protocols = response.json()
             
             # Filter protocols by RWA category and sum their TVL
-            target_categories = ["RWA", "RWA Lending", "Private Credit", "Real World Assets"]
             total_rwa_tvl = 0
             rwa_count = 0
+            snapshot = {}
             
             for protocol in protocols:
                 # Check if protocol is in target categories
-                if protocol.get('category') in target_categories:
+                if protocol.get('category') in RWA_CATEGORIES:
                     tvl = protocol.get('tvl', 0)
                     if tvl:
                         total_rwa_tvl += float(tvl)
                         rwa_count += 1
+                    
+                    # Keep zero-TVL members so "TVL went to zero" isn't reported as leaving the category
+                    slug = protocol.get('slug') or protocol.get('name')
+                    entry = snapshot.setdefault(slug, {
+                        "name": protocol.get('name', slug),
+                        "category": protocol.get('category'),
+                        "tvl": 0.0,
+                    })
+                    entry['tvl'] += float(tvl or 0)
             
             if total_rwa_tvl == 0:
                 raise ValueError("No RWA protocols found or total TVL is zero")
             
+            # Diff against the previous snapshot (skipped on first run)
+            # A broken snapshot file only loses the movers, never the headline metric
+            previous = self.load_rwa_snapshot(snapshot_file)
+            self.rwa_snapshot = snapshot
+            try:
+                self.rwa_movers = diff_protocol_snapshots(previous, snapshot) if previous is not None else None
+            except Exception as e:
+                print(f"⚠️  Failed to diff RWA snapshot: {e}")
+                self.rwa_movers = None
+            
             value = total_rwa_tvl
             self.results.append({
                 "Metric": "Total RWA TVL",
@@ -392,22 +696,34 @@ class MetricsFetcher:
             self.data["fed_net_liquidity"] = None
             return None
     
-    def fetch_all_metrics(self) -> Dict[str, Any]:
+    def fetch_all_metrics(self, coordinator: Optional[LeaseCoordinator] = None) -> Dict[str, Any]:
         """
         Fetch all 6 metrics and compile results.
         
+        Args:
+            coordinator: Optional lease coordinator to split sources with concurrent runners
+        
         Returns:
             Dictionary containing all metrics and metadata
         """
         print("🔄 Fetching Macro & Web3 Metrics...\n")
         
-        # Fetch all metrics
-        self.fetch_us_10y_yield()
-        self.fetch_bitcoin_price()
-        self.fetch_stablecoin_mcap()
-        self.fetch_rwa_tvl()
-        self.fetch_usdt_dominance()
-        self.fetch_fed_net_liquidity()
+        # (source name, fetch method, extra attributes to share with other runners)
+        sources = [
+            ('us_10y_yield', self.fetch_us_10y_yield, ()),
+            ('bitcoin_price', self.fetch_bitcoin_price, ()),
+            ('stablecoin_mcap', self.fetch_stablecoin_mcap, ()),
+            ('rwa_tvl', self.fetch_rwa_tvl, ('rwa_snapshot', 'rwa_movers')),
+            ('usdt_dominance', self.fetch_usdt_dominance, ()),
+            ('fed_net_liquidity', self.fetch_fed_net_liquidity, ()),
+        ]
+        
+        if coordinator is None:
+            # Fetch all metrics
+            for _, fetch, _ in sources:
+                fetch()
+        else:
+            self.fetch_coordinated(sources, coordinator)
         
         # Print results table
         print("\n" + "="*80)
@@ -421,6 +737,7 @@ class MetricsFetcher:
             "timestamp": datetime.utcnow().isoformat() + "Z",  # Explicitly mark as UTC
             "timestamp_unix": int(datetime.utcnow().timestamp()),
             "metrics": self.data,
+            "rwa_movers": self.rwa_movers,
             "summary": {
                 "total_metrics": len(self.results),
                 "successful": len([r for r in self.results if "✓" in r["Status"]]),
@@ -430,6 +747,84 @@ class MetricsFetcher:
         
         return output
     
+    def fetch_coordinated(self, sources: List[Tuple[str, Any, Tuple[str, ...]]], coordinator: LeaseCoordinator):
+        """
+        Fetch sources under per-source leases, merging results published by other runners.
+        A source this runner failed stays pending until another runner publishes it,
+        or until every live runner has failed it too.
+        
+        Args:
+            sources: List of (source name, fetch method, shared attribute names)
+            coordinator: Lease coordinator shared with concurrent runners
+        """
+        pending = list(sources)
+        failed = {}  # Source name -> our own failed payload, used if nobody else succeeds
+        try:
+            while pending:
+                coordinator.register()
+                for source in list(pending):
+                    name, fetch, attrs = source
+                    payload = coordinator.fresh_result(name)
+                    if payload is not None:
+                        print(f"ℹ️  Using {name} fetched by another runner")
+                    elif name in failed:
+                        if not coordinator.failed_by_all(name):
+                            continue  # Another runner may still fetch it
+                        payload = failed.pop(name)
+                    elif coordinator.acquire(f"source:{name}"):
+                        try:
+                            # Re-check: another runner may have published right before we leased
+                            payload = coordinator.fresh_result(name)
+                            if payload is None:
+                                payload = self._fetch_source(fetch, attrs)
+                                # Don't share failures: other runners retry once the lease is released
+                                if payload['data'] and all(v is not None for v in payload['data'].values()):
+                                    coordinator.publish(name, payload)
+                                else:
+                                    coordinator.record_failure(name)
+                                    if not coordinator.failed_by_all(name):
+                                        failed[name] = payload
+                                        payload = None
+                        finally:
+                            coordinator.release(f"source:{name}")
+                    
+                    if payload is not None:
+                        self.results.extend(payload['results'])
+                        self.data.update(payload['data'])
+                        for attr, value in payload['attrs'].items():
+                            setattr(self, attr, value)
+                        pending.remove(source)
+                
+                if pending:
+                    time.sleep(LEASE_POLL_SECONDS)
+        finally:
+            coordinator.unregister()
+    
+    def _fetch_source(self, fetch: Any, attrs: Tuple[str, ...]) -> Dict[str, Any]:
+        """
+        Run a fetch method and return what it produced without keeping it in
+        results/data, so it can be merged like a payload from another runner.
+        
+        Args:
+            fetch: Fetch method
+            attrs: Extra attribute names to include
+            
+        Returns:
+            Payload with results, data and attrs
+        """
+        results_before = len(self.results)
+        data_before = set(self.data)
+        fetch()
+        payload = {
+            "results": self.results[results_before:],
+            "data": {k: v for k, v in self.data.items() if k not in data_before},
+            "attrs": {attr: getattr(self, attr) for attr in attrs},
+        }
+        del self.results[results_before:]
+        for key in payload['data']:
+            del self.data[key]
+        return payload
+    
     def save_to_json(self, output: Dict[str, Any], filename: str = "dashboard_data.json"):
         """
         Save metrics data to JSON file.
@@ -465,6 +860,44 @@ class MetricsFetcher:
             print(f"⚠️  Failed to load old data: {e}")
             return None
     
+    def load_rwa_snapshot(self, filename: str = RWA_SNAPSHOT_FILE) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Load the previous per-protocol RWA TVL snapshot.
+        
+        Args:
+            filename: Snapshot filename to load
+            
+        Returns:
+            Dictionary of protocols keyed by slug or None if unavailable
+        """
+        try:
+            with open(filename, 'r') as f:
+                return json.load(f).get('protocols', {})
+        except FileNotFoundError:
+            print("ℹ️  No previous RWA snapshot found (first run)")
+            return None
+        except Exception as e:
+            print(f"⚠️  Failed to load RWA snapshot: {e}")
+            return None
+    
+    def save_rwa_snapshot(self, filename: str = RWA_SNAPSHOT_FILE):
+        """
+        Save the current per-protocol RWA TVL snapshot for the next run's diff.
+        
+        Args:
+            filename: Snapshot filename
+        """
+        if self.rwa_snapshot is None:
+            return
+        try:
+            with open(filename, 'w') as f:
+                json.dump({
+                    "timestamp": datetime.utcnow().isoformat() + "Z",
+                    "protocols": self.rwa_snapshot
+                }, f, indent=2, sort_keys=True)
+            print(f"✅ RWA snapshot saved to: {filename}")
+        except Exception as e:
+            print(f"❌ Failed to save RWA snapshot: {e}")
     
     def check_metrics_changed(self, new_data: Dict[str, Any], old_data: Optional[Dict[str, Any]]) -> Tuple[bool, Dict[str, str]]:
         """
@@ -550,13 +983,15 @@ class MetricsFetcher:
         return triggered, formatted_strings
     
     
-    def format_telegram_message(self, formatted_metrics: Dict[str, str]) -> str:
+    def format_telegram_message(self, formatted_metrics: Dict[str, str],
+                                rwa_movers: Optional[Dict[str, Any]] = None) -> str:
         """
         Format metrics data into HTML message for Telegram using pre-formatted strings.
         Only shows metrics that have changed (filters out unchanged metrics).
         
         Args:
             formatted_metrics: Dictionary of pre-formatted metric strings with deltas
+            rwa_movers: Optional RWA protocol diff (shown below the RWA TVL line)
             
         Returns:
             Formatted HTML string
@@ -608,6 +1043,8 @@ class MetricsFetcher:
             value = formatted_metrics.get(key, '')
             if value and '(➖)' not in value:
                 alpha_lines.append(f"{label} {value}")
+                if key == 'rwa_tvl' and rwa_movers:
+                    alpha_lines.extend(self.format_rwa_movers(rwa_movers))
         
         if alpha_lines:
             message_parts.append('\n<b>Alpha</b>')
@@ -615,6 +1052,28 @@ class MetricsFetcher:
         
         return '\n'.join(message_parts)
     
+    def format_rwa_movers(self, rwa_movers: Dict[str, Any], limit: int = 3) -> List[str]:
+        """
+        Format the top RWA protocol movers as indented Telegram lines.
+        
+        Args:
+            rwa_movers: RWA protocol diff from diff_protocol_snapshots
+            limit: Maximum number of inflows/outflows to show
+            
+        Returns:
+            List of HTML formatted lines
+        """
+        lines = []
+        for mover in rwa_movers.get('top_inflows', [])[:limit]:
+            lines.append(f"   🟢 {html.escape(mover['name'])} +${mover['delta']/1e6:,.1f}M")
+        for mover in rwa_movers.get('top_outflows', [])[:limit]:
+            lines.append(f"   🔴 {html.escape(mover['name'])} -${abs(mover['delta'])/1e6:,.1f}M")
+        for protocol in rwa_movers.get('entered', [])[:limit]:
+            lines.append(f"   ➕ {html.escape(protocol['name'])} (${protocol['tvl']/1e6:,.1f}M)")
+        for protocol in rwa_movers.get('exited', [])[:limit]:
+            lines.append(f"   ➖ {html.escape(protocol['name'])} (${protocol['tvl']/1e6:,.1f}M)")
+        return lines
+    
     
     
     def send_telegram_notification(self, message: str, telegram_bot_token: str, telegram_chat_id: str) -> bool:
@@ -654,12 +1113,14 @@ class MetricsFetcher:
 
 def main():
     """Main execution function."""
-    import os
-    
     # Get credentials from environment variables
     fred_api_key = os.getenv('FRED_API_KEY', '1be1d07bd97df586c3e81893338b87dc')
     telegram_bot_token = os.getenv('TELEGRAM_BOT_TOKEN', '')
     telegram_chat_id = os.getenv('TELEGRAM_CHAT_ID', '')
+    lease_db_path = os.getenv('LEASE_DB_PATH', '')
+    
+    # Coordinate with concurrent runners sharing the same lease database (optional)
+    coordinator = LeaseCoordinator(lease_db_path, owner=os.getenv('RUNNER_ID') or None) if lease_db_path else None
     
     # Initialize fetcher
     fetcher = MetricsFetcher(fred_api_key=fred_api_key)
@@ -670,7 +1131,7 @@ def main():
         old_data = fetcher.load_old_data("dashboard_data.json")
     
     # Fetch all metrics
-    new_data = fetcher.fetch_all_metrics()
+    new_data = fetcher.fetch_all_metrics(coordinator)
     
     # Check if any metrics breached thresholds (returns formatted strings with deltas)
     should_notify, formatted_metrics = fetcher.check_metrics_changed(new_data, old_data)
@@ -682,13 +1143,22 @@ def main():
             print("\n🚨 Threshold breached! Sending notification...")
         
         # Format and send Telegram notification with formatted strings
-        message = fetcher.format_telegram_message(formatted_metrics)
-        fetcher.send_telegram_notification(message, telegram_bot_token, telegram_chat_id)
+        message = fetcher.format_telegram_message(formatted_metrics, new_data.get('rwa_movers'))
+        
+        # Only one runner sends a given change (keyed by the previous snapshot and the message)
+        old_timestamp = old_data.get('timestamp') if old_data else None
+        notification_key = hashlib.sha256(f"{old_timestamp}|{message}".encode()).hexdigest()
+        if coordinator is not None and not coordinator.claim_notification(notification_key):
+            print("ℹ️  Notification already sent by another runner. Skipping.")
+        elif not fetcher.send_telegram_notification(message, telegram_bot_token, telegram_chat_id):
+            if coordinator is not None:
+                coordinator.unclaim_notification(notification_key)
     else:
         print("\nℹ️  Changes within threshold. Skipping notification.")
     
     # Save to JSON (always save to update timestamp)
     fetcher.save_to_json(new_data)
+    fetcher.save_rwa_snapshot()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,207 @@
+"""
+Tests for LeaseCoordinator and coordinated fetching, using a temporary SQLite
+database as the shared lease table and stub fetch functions instead of the APIs.
+"""
+
+import threading
+import time
+from collections import Counter
+
+import fetch_metrics
+from fetch_metrics import LeaseCoordinator, MetricsFetcher
+
+
+SOURCES = [
+    'us_10y_yield',
+    'bitcoin_price',
+    'stablecoin_mcap',
+    'rwa_tvl',
+    'usdt_dominance',
+    'fed_net_liquidity',
+]
+
+
+def make_fetcher(calls, lock, failing=(), started=None):
+    """Create a fetcher whose fetch methods are stubs that record each call."""
+    fetcher = MetricsFetcher()
+
+    def stub(name):
+        def fetch():
+            with lock:
+                calls[name] += 1
+            if started is not None and name in started:
+                started[name].set()
+            time.sleep(0.05)
+            ok = name not in failing
+            fetcher.results.append({
+                "Metric": name,
+                "Value": "1" if ok else "N/A",
+                "Source": "stub",
+                "Status": "✓ Success" if ok else "✗ Failed: stub"
+            })
+            fetcher.data[name] = 1.0 if ok else None
+            if name == 'rwa_tvl' and ok:
+                fetcher.rwa_snapshot = {"ondo": {"name": "Ondo", "category": "RWA", "tvl": 1.0}}
+                fetcher.rwa_movers = {"top_inflows": [], "top_outflows": [], "entered": [], "exited": []}
+        return fetch
+
+    for name in SOURCES:
+        setattr(fetcher, f"fetch_{name}", stub(name))
+    return fetcher
+
+
+def test_concurrent_runners_split_sources_and_merge(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_metrics, 'LEASE_POLL_SECONDS', 0.01)
+    db_path = str(tmp_path / "leases.db")
+    calls = Counter()
+    lock = threading.Lock()
+    barrier = threading.Barrier(3)
+    outputs = {}
+    claims = {}
+
+    def run(owner):
+        coordinator = LeaseCoordinator(db_path, owner=owner)
+        fetcher = make_fetcher(calls, lock)
+        barrier.wait()
+        output = fetcher.fetch_all_metrics(coordinator)
+        outputs[owner] = (output['metrics'], fetcher.rwa_snapshot)
+        claims[owner] = coordinator.claim_notification("change-1")
+
+    threads = [threading.Thread(target=run, args=(f"runner-{i}",)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Each source fetched exactly once across all runners
+    assert calls == Counter({name: 1 for name in SOURCES})
+
+    # Every runner ends with the same merged snapshot
+    merged = [outputs[owner] for owner in sorted(outputs)]
+    assert len(merged) == 3
+    assert all(result == merged[0] for result in merged)
+    assert set(merged[0][0]) == set(SOURCES)
+    assert merged[0][1] == {"ondo": {"name": "Ondo", "category": "RWA", "tvl": 1.0}}
+
+    # Exactly one runner may send the notification
+    assert sorted(claims.values()) == [False, False, True]
+
+
+def test_failed_source_is_not_published(tmp_path):
+    db_path = str(tmp_path / "leases.db")
+    calls = Counter()
+    lock = threading.Lock()
+
+    first = LeaseCoordinator(db_path, owner="first")
+    make_fetcher(calls, lock, failing=('bitcoin_price',)).fetch_all_metrics(first)
+    assert first.fresh_result('bitcoin_price') is None
+    assert first.fresh_result('us_10y_yield') is not None
+
+    # Another runner retries the failed source and reuses the rest
+    second = LeaseCoordinator(db_path, owner="second")
+    output = make_fetcher(calls, lock).fetch_all_metrics(second)
+    assert calls['bitcoin_price'] == 2
+    assert calls['us_10y_yield'] == 1
+    assert output['metrics']['bitcoin_price'] == 1.0
+
+
+def test_concurrent_runner_merges_retried_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_metrics, 'LEASE_POLL_SECONDS', 0.01)
+    db_path = str(tmp_path / "leases.db")
+    calls = Counter()
+    lock = threading.Lock()
+    bitcoin_started = threading.Event()
+    outputs = {}
+
+    def run(owner, failing, started=None):
+        coordinator = LeaseCoordinator(db_path, owner=owner)
+        fetcher = make_fetcher(calls, lock, failing=failing, started=started)
+        outputs[owner] = fetcher.fetch_all_metrics(coordinator)['metrics']
+
+    # "first" fails bitcoin_price while "second" is running, so "second" retries it
+    first = threading.Thread(target=run, args=("first", ('bitcoin_price',), {'bitcoin_price': bitcoin_started}))
+    second = threading.Thread(target=run, args=("second", ()))
+    first.start()
+    assert bitcoin_started.wait(5)
+    second.start()
+    first.join()
+    second.join()
+
+    assert calls['bitcoin_price'] == 2
+    assert outputs["first"] == outputs["second"]
+    assert outputs["first"]['bitcoin_price'] == 1.0
+
+
+def test_concurrent_runners_fall_back_when_all_fail(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_metrics, 'LEASE_POLL_SECONDS', 0.01)
+    db_path = str(tmp_path / "leases.db")
+    calls = Counter()
+    lock = threading.Lock()
+    barrier = threading.Barrier(2)
+    outputs = {}
+
+    def run(owner):
+        coordinator = LeaseCoordinator(db_path, owner=owner)
+        fetcher = make_fetcher(calls, lock, failing=('bitcoin_price',))
+        barrier.wait()
+        outputs[owner] = fetcher.fetch_all_metrics(coordinator)['metrics']
+
+    threads = [threading.Thread(target=run, args=(owner,)) for owner in ("first", "second")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert outputs["first"] == outputs["second"]
+    assert outputs["first"]['bitcoin_price'] is None
+    assert outputs["first"]['us_10y_yield'] == 1.0
+
+
+def test_expired_lease_is_taken_over(tmp_path):
+    db_path = str(tmp_path / "leases.db")
+    holder = LeaseCoordinator(db_path, owner="holder", ttl=0.1)
+    other = LeaseCoordinator(db_path, owner="other")
+
+    assert holder.acquire("source:bitcoin_price")
+    assert holder.acquire("source:bitcoin_price")  # Renewal by the same owner
+    assert not other.acquire("source:bitcoin_price")
+
+    time.sleep(0.15)
+    assert other.acquire("source:bitcoin_price")
+    assert not holder.acquire("source:bitcoin_price")
+
+    # Releasing someone else's lease is a no-op
+    holder.release("source:bitcoin_price")
+    assert not holder.acquire("source:bitcoin_price")
+
+
+def test_unclaim_notification(tmp_path):
+    db_path = str(tmp_path / "leases.db")
+    first = LeaseCoordinator(db_path, owner="first")
+    second = LeaseCoordinator(db_path, owner="second")
+
+    assert first.claim_notification("change-1")
+    assert not second.claim_notification("change-1")
+
+    # Only the owner can drop its claim
+    second.unclaim_notification("change-1")
+    assert not second.claim_notification("change-1")
+
+    first.unclaim_notification("change-1")
+    assert second.claim_notification("change-1")
+
+
+def test_old_results_and_claims_are_pruned(tmp_path):
+    db_path = str(tmp_path / "leases.db")
+    coordinator = LeaseCoordinator(db_path, owner="runner", result_max_age=0.1)
+
+    coordinator.publish("bitcoin_price", {"results": [], "data": {"bitcoin_price": 1.0}, "attrs": {}})
+    coordinator.claim_notification("change-1")
+    time.sleep(0.15)
+    coordinator.publish("us_10y_yield", {"results": [], "data": {"us_10y_yield": 4.0}, "attrs": {}})
+    coordinator.claim_notification("change-2")
+
+    sources = [row[0] for row in coordinator.conn.execute("SELECT source FROM results")]
+    keys = [row[0] for row in coordinator.conn.execute("SELECT key FROM notifications")]
+    assert sources == ["us_10y_yield"]
+    assert keys == ["change-2"]
@@ -0,0 +1,118 @@
+"""
+Tests for the per-protocol RWA TVL diff, its Telegram formatting and the
+snapshot handling in fetch_rwa_tvl (with the DefiLlama response stubbed).
+"""
+
+import json
+
+import fetch_metrics
+from fetch_metrics import MetricsFetcher, diff_protocol_snapshots
+
+
+def protocol(name, tvl, category="RWA"):
+    return {"name": name, "category": category, "tvl": tvl}
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+def stub_protocols(monkeypatch, protocols):
+    monkeypatch.setattr(fetch_metrics.requests, 'get', lambda *args, **kwargs: FakeResponse(protocols))
+
+
+def test_top_k_limits_and_order():
+    previous = {slug: protocol(slug.upper(), 100.0) for slug in "abcdef"}
+    current = {
+        "a": protocol("A", 110.0),
+        "b": protocol("B", 150.0),
+        "c": protocol("C", 130.0),
+        "d": protocol("D", 95.0),
+        "e": protocol("E", 50.0),
+        "f": protocol("F", 80.0),
+    }
+    diff = diff_protocol_snapshots(previous, current, top_k=2)
+
+    assert [m['slug'] for m in diff['top_inflows']] == ["b", "c"]
+    assert [m['delta'] for m in diff['top_inflows']] == [50.0, 30.0]
+    assert [m['slug'] for m in diff['top_outflows']] == ["e", "f"]
+    assert [m['delta'] for m in diff['top_outflows']] == [-50.0, -20.0]
+
+
+def test_entered_and_exited_are_not_movers():
+    previous = {"a": protocol("A", 100.0), "gone": protocol("Gone", 500.0)}
+    current = {"a": protocol("A", 120.0), "new": protocol("New", 900.0)}
+    diff = diff_protocol_snapshots(previous, current)
+
+    assert [m['slug'] for m in diff['top_inflows']] == ["a"]
+    assert diff['top_outflows'] == []
+    assert diff['entered'] == [{"slug": "new", "name": "New", "tvl": 900.0}]
+    assert diff['exited'] == [{"slug": "gone", "name": "Gone", "tvl": 500.0}]
+
+    # Each protocol shows up once in the Telegram lines
+    lines = MetricsFetcher().format_rwa_movers(diff)
+    assert sum("New" in line for line in lines) == 1
+    assert sum("Gone" in line for line in lines) == 1
+
+
+def test_drop_to_zero_is_an_outflow():
+    diff = diff_protocol_snapshots({"a": protocol("A", 40.0)}, {"a": protocol("A", 0.0)})
+
+    assert diff['exited'] == []
+    assert diff['top_outflows'] == [
+        {"slug": "a", "name": "A", "tvl": 0.0, "delta": -40.0, "delta_pct": -100.0}
+    ]
+
+
+def test_delta_pct_none_when_old_tvl_is_zero():
+    diff = diff_protocol_snapshots({"a": protocol("A", 0.0)}, {"a": protocol("A", 25.0)})
+
+    assert diff['entered'] == []
+    assert diff['top_inflows'][0]['delta'] == 25.0
+    assert diff['top_inflows'][0]['delta_pct'] is None
+
+
+def test_format_rwa_movers_escapes_names():
+    diff = diff_protocol_snapshots({"a": protocol("A & B", 1e6)}, {"a": protocol("A & B", 3e6)})
+
+    assert MetricsFetcher().format_rwa_movers(diff) == ["   🟢 A &amp; B +$2.0M"]
+
+
+def test_first_run_has_no_movers(tmp_path, monkeypatch):
+    stub_protocols(monkeypatch, [{"slug": "ondo", "name": "Ondo", "category": "RWA", "tvl": 10.0}])
+    fetcher = MetricsFetcher()
+
+    assert fetcher.fetch_rwa_tvl(str(tmp_path / "missing.json")) == 10.0
+    assert fetcher.rwa_movers is None
+    assert fetcher.rwa_snapshot == {"ondo": protocol("Ondo", 10.0)}
+
+
+def test_snapshot_sums_duplicate_slugs_and_keeps_zero_tvl(tmp_path, monkeypatch):
+    stub_protocols(monkeypatch, [
+        {"slug": "ondo", "name": "Ondo", "category": "RWA", "tvl": 10.0},
+        {"slug": "ondo", "name": "Ondo", "category": "RWA", "tvl": 5.0},
+        {"slug": "idle", "name": "Idle", "category": "RWA", "tvl": None},
+        {"slug": "dex", "name": "Dex", "category": "Dexes", "tvl": 99.0},
+    ])
+    fetcher = MetricsFetcher()
+
+    assert fetcher.fetch_rwa_tvl(str(tmp_path / "missing.json")) == 15.0
+    assert fetcher.rwa_snapshot == {"ondo": protocol("Ondo", 15.0), "idle": protocol("Idle", 0.0)}
+
+
+def test_broken_snapshot_does_not_fail_metric(tmp_path, monkeypatch):
+    stub_protocols(monkeypatch, [{"slug": "ondo", "name": "Ondo", "category": "RWA", "tvl": 10.0}])
+    snapshot_file = tmp_path / "rwa_snapshot.json"
+    snapshot_file.write_text(json.dumps({"protocols": {"ondo": {"name": "Ondo"}}}))
+    fetcher = MetricsFetcher()
+
+    assert fetcher.fetch_rwa_tvl(str(snapshot_file)) == 10.0
+    assert fetcher.data["rwa_tvl"] == 10.0
+    assert fetcher.rwa_movers is None